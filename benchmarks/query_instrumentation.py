@@ -0,0 +1,109 @@
+"""Measure the per query overhead of ``InstrumentedConnection``.
+
+The database round trip is replaced by a stub returning immediately, so the
+numbers are the cost of the instrumentation alone.
+
+Run from the project root with ``uv run python -m benchmarks.query_instrumentation``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, override
+
+from asyncpg import Connection
+
+from app.lib.db import InstrumentedConnection, QueryStatsMiddleware
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from litestar.types import Message, Receive, ReceiveMessage, Scope, Send
+
+_QUERIES = (
+    "SELECT EXISTS (SELECT 1 FROM account WHERE email_1 = $1 OR email_2 = $1)",
+    "SELECT * FROM account WHERE id = 42",
+    "SELECT * FROM account WHERE id IN (1, 2, 3)",
+)
+
+
+class StubConnection(Connection):
+    """Connection answering every query without a database."""
+
+    def __init__(self) -> None:
+        """Skip the protocol setup, nothing is ever sent."""
+
+    @override
+    def is_closed(self) -> bool:
+        return True
+
+    @override
+    async def fetchval(self, query: str, *args: Any, **kwargs: Any) -> Any:
+        return 1
+
+
+class InstrumentedStubConnection(InstrumentedConnection, StubConnection):
+    """``InstrumentedConnection`` layered over the stub."""
+
+
+async def _run_queries(connection: Connection, number: int) -> float:
+    start = perf_counter()
+    for i in range(number):
+        await connection.fetchval(_QUERIES[i % len(_QUERIES)], i)
+    return perf_counter() - start
+
+
+async def _run_in_request(connection: Connection, number: int) -> float:
+    elapsed = 0.0
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        nonlocal elapsed
+        elapsed = await _run_queries(connection, number)
+
+    async def receive() -> ReceiveMessage:
+        return {"type": "http.disconnect"}
+
+    async def send(message: Message) -> None:
+        pass
+
+    scope: Any = {"type": "http", "path": "/bench"}
+    await QueryStatsMiddleware().handle(scope, receive, send, app)
+    return elapsed
+
+
+async def _best(run: Callable[[], Awaitable[float]], repeat: int) -> float:
+    return min([await run() for _ in range(repeat)])
+
+
+async def _bench(number: int, repeat: int) -> None:
+    plain = StubConnection()
+    instrumented = InstrumentedStubConnection()
+
+    rows = (
+        ("plain", await _best(lambda: _run_queries(plain, number), repeat)),
+        (
+            "instrumented, no request",
+            await _best(lambda: _run_queries(instrumented, number), repeat),
+        ),
+        (
+            "instrumented, in request",
+            await _best(lambda: _run_in_request(instrumented, number), repeat),
+        ),
+    )
+
+    baseline = rows[0][1]
+    print(f"{'connection':<26} {'µs/query':>10} {'overhead µs':>12}")  # noqa: T201
+    for name, elapsed in rows:
+        per_query = elapsed / number * 1e6
+        overhead = (elapsed - baseline) / number * 1e6
+        print(f"{name:<26} {per_query:>10.3f} {overhead:>12.3f}")  # noqa: T201
+
+
+def main() -> None:
+    """Run the benchmark."""
+    asyncio.run(_bench(number=200_000, repeat=5))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Compare JSON and msgpack payload size and encode/decode time.
+
+Run from the project root with ``uv run python -m benchmarks.serialization``.
+"""
+
+from __future__ import annotations
+
+import timeit
+
+import msgspec
+
+from app.domain.accounts.schemas import AccountRegister
+from app.lib.schema import BaseStruct, get_json_decoder, get_msgpack_decoder
+from app.lib.serialization import encode_msgpack
+
+
+class TelemetrySample(BaseStruct):
+    """Representative device telemetry reading."""
+
+    device_id: str
+    timestamp: int
+    temperature: float
+    humidity: float
+    battery: int
+    online: bool
+
+
+def _account() -> AccountRegister:
+    return AccountRegister(
+        user_type=1,
+        email_1="jane.doe@example.com",
+        email_2=None,
+        password="correct horse battery staple",
+        first_name="Jane",
+        middle_name=None,
+        last_name="Doe",
+    )
+
+
+def _telemetry(size: int) -> list[TelemetrySample]:
+    return [
+        TelemetrySample(
+            device_id=f"device-{i % 32:04d}",
+            timestamp=1_760_000_000 + i,
+            temperature=21.5 + (i % 10) / 10,
+            humidity=40.25 + (i % 7),
+            battery=100 - i % 100,
+            online=i % 5 != 0,
+        )
+        for i in range(size)
+    ]
+
+
+def _bench[T](name: str, value: T, type_: type[T], number: int) -> None:
+    json_encoder = msgspec.json.Encoder()
+    json_decoder = get_json_decoder(type_)
+    msgpack_decoder = get_msgpack_decoder(type_)
+
+    json_payload = json_encoder.encode(value)
+    msgpack_payload = encode_msgpack(value)
+
+    rows = (
+        (
+            "json",
+            len(json_payload),
+            timeit.timeit(lambda: json_encoder.encode(value), number=number),
+            timeit.timeit(lambda: json_decoder.decode(json_payload), number=number),
+        ),
+        (
+            "msgpack",
+            len(msgpack_payload),
+            timeit.timeit(lambda: encode_msgpack(value), number=number),
+            timeit.timeit(lambda: msgpack_decoder.decode(msgpack_payload), number=number),
+        ),
+    )
+
+    print(f"\n{name}")  # noqa: T201
+    print(f"{'format':<8} {'bytes':>8} {'encode µs':>10} {'decode µs':>10}")  # noqa: T201
+    for fmt, size, encode, decode in rows:
+        print(  # noqa: T201
+            f"{fmt:<8} {size:>8} {encode / number * 1e6:>10.2f} {decode / number * 1e6:>10.2f}"
+        )
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    _bench("AccountRegister", _account(), AccountRegister, number=100_000)
+    for size in (10, 100, 1000):
+        _bench(
+            f"telemetry batch ({size} samples)",
+            _telemetry(size),
+            list[TelemetrySample],
+            number=max(100, 100_000 // size),
+        )
+
+
+if __name__ == "__main__":
+    main()
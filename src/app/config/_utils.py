@@ -11,7 +11,7 @@ if TYPE_CHECKING:
 BASE_DIR = Path(__file__).parent.parent
 TRUE_VALUES = frozenset({"True", "true", "1", "yes", "YES", "Y", "y", "T", "t"})
 
-type ParseTypes = bool | int | str | list[str] | Path | list[Path]
+type ParseTypes = bool | int | float | str | list[str] | Path | list[Path]
 
 
 class MissingType:
@@ -38,6 +38,12 @@ def get_env(
 ) -> Callable[[], int]: ...
 
 
+@overload
+def get_env(
+    key: str, default: float, type_hint: MissingType = _MISSING
+) -> Callable[[], float]: ...
+
+
 @overload
 def get_env(
     key: str, default: str, type_hint: MissingType = _MISSING
@@ -92,6 +98,12 @@ def get_config_val(
 def get_config_val(key: str, default: int, type_hint: MissingType = _MISSING) -> int: ...
 
 
+@overload
+def get_config_val(
+    key: str, default: float, type_hint: MissingType = _MISSING
+) -> float: ...
+
+
 @overload
 def get_config_val(key: str, default: str, type_hint: MissingType = _MISSING) -> str: ...
 
@@ -146,6 +158,11 @@ def get_config_val[T](  # noqa: PLR0911
         if type_hint is _MISSING:
             return cast("T", int_value)
         return int_value
+    if typ is float:
+        float_value = float(value)
+        if type_hint is _MISSING:
+            return cast("T", float_value)
+        return float_value
     if typ is Path:
         path_value = Path(value)
         if type_hint is _MISSING:
@@ -18,9 +18,14 @@ from litestar.openapi.config import OpenAPIConfig
 from litestar.openapi.plugins import ScalarRenderPlugin
 from litestar.plugins.problem_details import ProblemDetailsConfig
 from litestar.plugins.structlog import StructlogConfig
-from litestar_asyncpg import AsyncpgConfig, PoolConfig
+from litestar_asyncpg import PoolConfig
 
 from app.__about__ import __version__ as current_version
+from app.lib.db import (
+    GuardedAsyncpgConfig,
+    InstrumentedConnection,
+    prepare_hot_statements,
+)
 
 from .settings import get_settings
 
@@ -51,11 +56,16 @@ class PluginsConfig:
     PROBLEM_DETAILS: ProblemDetailsConfig = field(
         default_factory=lambda: ProblemDetailsConfig(enable_for_all_http_exceptions=True)
     )
-    ASYNCPG: AsyncpgConfig = field(
-        default_factory=lambda: AsyncpgConfig(
+    ASYNCPG: GuardedAsyncpgConfig = field(
+        default_factory=lambda: GuardedAsyncpgConfig(
             pool_config=PoolConfig(
                 dsn=settings.db.DSN,
                 connect_kwargs={"command_timeout": settings.db.POOL_COMMAND_TIMEOUT},
+                # always instrumented, the database guard is fed from the stats.
+                connection_class=InstrumentedConnection,
+                min_size=settings.db.POOL_MIN_SIZE,
+                max_size=settings.db.POOL_MAX_SIZE,
+                init=prepare_hot_statements,
             ),
             pool_app_state_key=settings.db.POOL_APP_STATE_KEY,
             pool_dependency_key=settings.db.POOL_DEPENDENCY_KEY,
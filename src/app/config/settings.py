@@ -32,6 +32,8 @@ class DatabaseSettings:
     POOL_COMMAND_TIMEOUT: int = field(
         default_factory=get_env("DATABASE_POOL_COMMAND_TIMEOUT", 30)
     )
+    POOL_MIN_SIZE: int = field(default_factory=get_env("DATABASE_POOL_MIN_SIZE", 10))
+    POOL_MAX_SIZE: int = field(default_factory=get_env("DATABASE_POOL_MAX_SIZE", 10))
     POOL_APP_STATE_KEY: str = field(
         default_factory=get_env("DATABASE_POOL_APP_STATE_KEY", "db_pool")
     )
@@ -41,6 +43,57 @@ class DatabaseSettings:
     CONNECTION_DEPENDENCY_KEY: str = field(
         default_factory=get_env("DATABASE_CONNECTION_DEPENDENCY_KEY", "db_connection")
     )
+    LIMIT_INITIAL: int = field(default_factory=get_env("DATABASE_LIMIT_INITIAL", 10))
+    LIMIT_MIN: int = field(default_factory=get_env("DATABASE_LIMIT_MIN", 2))
+    LIMIT_MAX: int = field(default_factory=get_env("DATABASE_LIMIT_MAX", 50))
+    LIMIT_LATENCY_TARGET: int = field(
+        default_factory=get_env("DATABASE_LIMIT_LATENCY_TARGET_MS", 250)
+    )
+    LIMIT_QUEUE_TIMEOUT: int = field(
+        default_factory=get_env("DATABASE_LIMIT_QUEUE_TIMEOUT_MS", 1000)
+    )
+    BREAKER_FAILURE_RATE: float = field(
+        default_factory=get_env("DATABASE_BREAKER_FAILURE_RATE", 0.5)
+    )
+    BREAKER_SLOW_CALL: int = field(
+        default_factory=get_env("DATABASE_BREAKER_SLOW_CALL_MS", 5000)
+    )
+    BREAKER_WINDOW: int = field(default_factory=get_env("DATABASE_BREAKER_WINDOW", 50))
+    BREAKER_MIN_CALLS: int = field(
+        default_factory=get_env("DATABASE_BREAKER_MIN_CALLS", 20)
+    )
+    BREAKER_OPEN_DURATION: int = field(
+        default_factory=get_env("DATABASE_BREAKER_OPEN_SECONDS", 10)
+    )
+    BREAKER_PROBES: int = field(default_factory=get_env("DATABASE_BREAKER_PROBES", 3))
+    QUERY_INSTRUMENTATION: bool = field(
+        default_factory=get_env("DATABASE_QUERY_INSTRUMENTATION", True)
+    )
+    QUERY_REPEAT_THRESHOLD: int = field(
+        default_factory=get_env("DATABASE_QUERY_REPEAT_THRESHOLD", 10)
+    )
+
+
+@dataclass
+class AccountSettings:
+    """Accounts configuration."""
+
+    EMAIL_INDEX_ENABLED: bool = field(default_factory=get_env("EMAIL_INDEX_ENABLED", True))
+    EMAIL_INDEX_CAPACITY: int = field(
+        default_factory=get_env("EMAIL_INDEX_CAPACITY", 1_000_000)
+    )
+    EMAIL_INDEX_FALSE_POSITIVE_RATE: float = field(
+        default_factory=get_env("EMAIL_INDEX_FALSE_POSITIVE_RATE", 0.001)
+    )
+    EMAIL_INDEX_MAX_BYTES: int = field(
+        default_factory=get_env("EMAIL_INDEX_MAX_BYTES", 4 * 1024 * 1024)
+    )
+    EMAIL_INDEX_REFRESH_INTERVAL: int = field(
+        default_factory=get_env("EMAIL_INDEX_REFRESH_INTERVAL", 3600)
+    )
+    EMAIL_INDEX_SCAN_PREFETCH: int = field(
+        default_factory=get_env("EMAIL_INDEX_SCAN_PREFETCH", 5000)
+    )
 
 
 @dataclass
@@ -49,6 +102,7 @@ class ServerSettings:
 
     HOST: str = field(default_factory=get_env("LITESTAR_HOST", "127.0.0.1"))
     PORT: int = field(default_factory=get_env("LITESTAR_PORT", 8000))
+    DRAIN_TIMEOUT: int = field(default_factory=get_env("SERVER_DRAIN_TIMEOUT", 25))
 
 
 @dataclass
@@ -130,6 +184,7 @@ class Settings:
 
     app: AppSettings = field(default_factory=AppSettings)
     db: DatabaseSettings = field(default_factory=DatabaseSettings)
+    accounts: AccountSettings = field(default_factory=AccountSettings)
     server: ServerSettings = field(default_factory=ServerSettings)
     log: LoggingSettings = field(default_factory=LoggingSettings)
 
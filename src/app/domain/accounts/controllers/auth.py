@@ -1,18 +1,29 @@
 from __future__ import annotations
 
 from litestar import Controller, post
+from litestar.di import Provide
+from litestar.exceptions import HTTPException
+from litestar.status_codes import HTTP_409_CONFLICT
 
 from app.domain.accounts import urls
 from app.domain.accounts.schemas import AccountRegister
+from app.domain.accounts.services import UserService, provide_user_service
 
 
 class AuthController(Controller):
     """AuthController."""
 
     tags = ["Authentication"]
+    dependencies = {"users": Provide(provide_user_service)}
 
     @post(path=urls.ACCOUNT_REGISTER)
-    async def signup(self, data: AccountRegister) -> str:
+    async def signup(self, data: AccountRegister, users: UserService) -> str:
         """Signup."""
+        for email in (data.email_1, data.email_2):
+            if email is not None and await users.is_email_taken(email):
+                raise HTTPException(
+                    status_code=HTTP_409_CONFLICT, detail="Email already registered."
+                )
+
         print(data.to_dict())
         return "dummy"
@@ -1,15 +1,44 @@
-from app.lib.schema import BaseStruct
+from typing import Annotated
 
-__all__ = ("AccountRegister",)
+from msgspec import Meta
+
+from app.lib.schema import BaseStruct, validator
+
+__all__ = ("AccountRegister", "normalize_email")
+
+Email = Annotated[str, Meta(max_length=254, pattern=r"^\s*[^@\s]+@[^@\s]+\.[^@\s]+\s*$")]
+Password = Annotated[str, Meta(min_length=8, max_length=128)]
+Name = Annotated[str, Meta(min_length=1, max_length=100)]
+
+
+def normalize_email(email: str) -> str:
+    """Return the canonical form an email is stored and compared in."""
+    return email.strip().casefold()
 
 
 class AccountRegister(BaseStruct):
     """Account Register."""
 
-    user_type: int
-    email_1: str
-    email_2: str | None
-    password: str
-    first_name: str
-    middle_name: str | None
-    last_name: str
+    user_type: Annotated[int, Meta(ge=0)]
+    email_1: Email
+    email_2: Email | None
+    password: Password
+    first_name: Name
+    middle_name: Name | None
+    last_name: Name
+
+    @staticmethod
+    @validator("email_1", "email_2")
+    def _normalize_email(value: str) -> str:
+        return normalize_email(value)
+
+    @staticmethod
+    @validator("password")
+    def _check_password(value: str) -> str:
+        if not any(c.isalpha() for c in value) or all(c.isalpha() for c in value):
+            msg = "Password must contain both letters and digits or symbols."
+            raise ValueError(msg)
+        if value.strip() != value:
+            msg = "Password must not start or end with whitespace."
+            raise ValueError(msg)
+        return value
@@ -1,4 +1,331 @@
 from __future__ import annotations
 
+import asyncio
+from contextlib import aclosing
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
-# class UserService:
+from asyncpg import UniqueViolationError
+from litestar.exceptions import HTTPException
+from litestar.status_codes import HTTP_409_CONFLICT
+from structlog.stdlib import get_logger
+
+from app.config.settings import get_settings
+from app.domain.accounts.schemas import normalize_email
+from app.lib.bloom import BloomFilter
+from app.lib.db import register_hot_statements
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, AsyncIterator
+
+    from asyncpg import Connection, Pool
+    from asyncpg.pool import PoolConnectionProxy
+    from litestar import Litestar
+
+    from app.domain.accounts.schemas import AccountRegister
+
+__all__ = (
+    "EmailIndex",
+    "UserService",
+    "get_email_index",
+    "provide_user_service",
+)
+
+
+logger = get_logger()
+
+_EMAIL_EXISTS_SQL = (
+    "SELECT EXISTS (SELECT 1 FROM account WHERE email_1 = $1 OR email_2 = $1)"
+)
+_EMAIL_SCAN_SQL = (
+    "SELECT email_1 FROM account "
+    "UNION ALL SELECT email_2 FROM account WHERE email_2 IS NOT NULL"
+)
+_EMAILS_TAKEN_SQL = (
+    "SELECT EXISTS (SELECT 1 FROM account "
+    "WHERE email_1 IN ($1, $2) OR email_2 IN ($1, $2))"
+)
+# serialises registrations of the same email across connections and processes.
+_EMAIL_LOCK_SQL = "SELECT pg_advisory_xact_lock(hashtextextended($1, 0))"
+_ACCOUNT_INSERT_SQL = (
+    "INSERT INTO account "
+    "(user_type, email_1, email_2, password, first_name, middle_name, last_name) "
+    "VALUES ($1, $2, $3, $4, $5, $6, $7) RETURNING id"
+)
+_ACCOUNT_DELETE_SQL = "DELETE FROM account WHERE id = $1 RETURNING email_1, email_2"
+
+register_hot_statements(
+    _EMAIL_EXISTS_SQL, _EMAILS_TAKEN_SQL, _EMAIL_LOCK_SQL, _ACCOUNT_INSERT_SQL
+)
+
+
+class EmailIndex:
+    """In-process probabilistic index of registered emails.
+
+    A hit has to be confirmed against the database, a miss lets the
+    pre-check skip its query. Until the first scan completes every lookup
+    is treated as a hit.
+
+    The index is per process: an email registered through another worker or
+    replica is only picked up on the next refresh, so a miss is *not* proof
+    that the email is free. It only cuts down pre-check queries, uniqueness
+    across both ``account.email_1`` and ``email_2`` is enforced by
+    ``UserService.create``.
+    """
+
+    __slots__ = (
+        "_capacity",
+        "_error_rate",
+        "_filter",
+        "_max_bytes",
+        "_pending",
+        "_ready",
+        "_refresh_interval",
+        "_refresh_task",
+        "_scan_prefetch",
+    )
+
+    def __init__(
+        self,
+        capacity: int,
+        error_rate: float,
+        max_bytes: int,
+        refresh_interval: int,
+        scan_prefetch: int,
+    ) -> None:
+        self._capacity = capacity
+        self._error_rate = error_rate
+        self._max_bytes = max_bytes
+        self._refresh_interval = refresh_interval
+        self._scan_prefetch = scan_prefetch
+        self._filter = self._new_filter()
+        self._pending: set[str] | None = None
+        self._ready = False
+        self._refresh_task: asyncio.Task[None] | None = None
+
+    @property
+    def ready(self) -> bool:
+        """Return whether the index has been populated."""
+        return self._ready
+
+    def _new_filter(self) -> BloomFilter:
+        return BloomFilter.for_capacity(self._capacity, self._error_rate, self._max_bytes)
+
+    def might_contain(self, email: str) -> bool:
+        """Return ``False`` only if the email is definitely not registered."""
+        if not self._ready:
+            return True
+        return normalize_email(email) in self._filter
+
+    def add(self, *emails: str | None) -> None:
+        """Record newly registered emails."""
+        for email in emails:
+            if email is None:
+                continue
+            key = normalize_email(email)
+            self._filter.add(key)
+            if self._pending is not None:
+                self._pending.add(key)
+
+    def discard(self, *emails: str | None) -> None:
+        """Record removed emails.
+
+        Bloom filters cannot forget values, a removed email stays a possible
+        hit (answered by the database) until the next refresh drops it.
+        """
+        if self._pending is None:
+            return
+        for email in emails:
+            if email is not None:
+                self._pending.discard(normalize_email(email))
+
+    async def rebuild(self, emails: AsyncIterator[str]) -> int:
+        """Replace the filter with one built from ``emails``.
+
+        Emails added while the scan is running are carried over to the new filter.
+        """
+        fresh = self._new_filter()
+        self._pending = set()
+        try:
+            async for email in emails:
+                fresh.add(normalize_email(email))
+            for key in self._pending:
+                fresh.add(key)
+        finally:
+            self._pending = None
+
+        self._filter = fresh
+        self._ready = True
+        return fresh.count
+
+    async def refresh(self, pool: Pool) -> None:
+        """Rebuild the index with a streaming scan of the account table."""
+        async with (
+            pool.acquire() as connection,
+            aclosing(
+                UserService.stream_emails(connection, prefetch=self._scan_prefetch)
+            ) as emails,
+        ):
+            count = await self.rebuild(emails)
+
+        await logger.ainfo(
+            "Email index refreshed",
+            emails=count,
+            size_bytes=self._filter.size_bytes,
+            estimated_error_rate=self._filter.estimated_error_rate(),
+        )
+
+    async def _refresh_periodically(self, pool: Pool) -> None:
+        while True:
+            await asyncio.sleep(self._refresh_interval)
+            try:
+                await self.refresh(pool)
+            except Exception:  # noqa: BLE001
+                await logger.aexception("Email index refresh failed")
+
+    async def on_startup(self, app: Litestar) -> None:
+        """Populate the index and schedule periodic refreshes."""
+        pool: Pool = app.state[get_settings().db.POOL_APP_STATE_KEY]
+        try:
+            await self.refresh(pool)
+        except Exception:  # noqa: BLE001
+            await logger.aexception("Email index build failed, falling back to database")
+
+        if self._refresh_interval > 0:
+            self._refresh_task = asyncio.create_task(self._refresh_periodically(pool))
+
+    async def on_shutdown(self, app: Litestar) -> None:
+        """Stop periodic refreshes."""
+        task, self._refresh_task = self._refresh_task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+
+@lru_cache(maxsize=1, typed=True)
+def get_email_index() -> EmailIndex:
+    """Return the process wide email index."""
+    settings = get_settings().accounts
+    return EmailIndex(
+        capacity=settings.EMAIL_INDEX_CAPACITY,
+        error_rate=settings.EMAIL_INDEX_FALSE_POSITIVE_RATE,
+        max_bytes=settings.EMAIL_INDEX_MAX_BYTES,
+        refresh_interval=settings.EMAIL_INDEX_REFRESH_INTERVAL,
+        scan_prefetch=settings.EMAIL_INDEX_SCAN_PREFETCH,
+    )
+
+
+class UserService:
+    """Account persistence."""
+
+    __slots__ = ("_connection", "_email_index")
+
+    def __init__(
+        self,
+        connection: Connection | PoolConnectionProxy,
+        email_index: EmailIndex | None = None,
+    ) -> None:
+        self._connection = connection
+        self._email_index = email_index
+
+    @staticmethod
+    async def stream_emails(
+        connection: Connection | PoolConnectionProxy, prefetch: int = 5000
+    ) -> AsyncGenerator[str]:
+        """Stream every registered email without loading them all at once.
+
+        The scan runs in a read-only transaction that is only closed when the
+        generator is, callers must close it (``contextlib.aclosing``) so an
+        early exit does not leave the transaction open on a pooled connection.
+
+        Yields
+        ------
+        str
+            A registered email address.
+        """
+        async with connection.transaction(readonly=True):
+            async for record in connection.cursor(_EMAIL_SCAN_SQL, prefetch=prefetch):
+                yield record[0]  # noqa: ASYNC119 - closed by callers via aclosing
+
+    async def is_email_taken(self, email: str) -> bool:
+        """Return whether an account already uses ``email``.
+
+        Best-effort pre-check, a concurrent or cross-process registration can
+        still slip past it and is rejected by ``create``.
+        """
+        if self._email_index is not None and not self._email_index.might_contain(email):
+            return False
+        return bool(
+            await self._connection.fetchval(_EMAIL_EXISTS_SQL, normalize_email(email))
+        )
+
+    async def create(self, data: AccountRegister, password_hash: str) -> int:
+        """Insert an account and return its id.
+
+        Raises a 409 when either email is already registered in either
+        column. The check runs in the insert's transaction while holding an
+        advisory lock per email, so concurrent registrations of the same
+        email, from any process, are serialised and only the first succeeds.
+        """
+        email_1 = normalize_email(data.email_1)
+        email_2 = normalize_email(data.email_2) if data.email_2 is not None else None
+        # indexed before the insert so a concurrent lookup can never miss it.
+        if self._email_index is not None:
+            self._email_index.add(email_1, email_2)
+
+        try:
+            account_id = await self._insert(data, email_1, email_2, password_hash)
+        except UniqueViolationError:
+            account_id = None
+        if account_id is None:
+            raise HTTPException(
+                status_code=HTTP_409_CONFLICT, detail="Email already registered."
+            )
+        return account_id
+
+    async def _insert(
+        self,
+        data: AccountRegister,
+        email_1: str,
+        email_2: str | None,
+        password_hash: str,
+    ) -> int | None:
+        connection = self._connection
+        async with connection.transaction():
+            # sorted so two registrations sharing both emails cannot deadlock.
+            for email in sorted({e for e in (email_1, email_2) if e is not None}):
+                await connection.execute(_EMAIL_LOCK_SQL, email)
+            if await connection.fetchval(_EMAILS_TAKEN_SQL, email_1, email_2):
+                return None
+            return await connection.fetchval(
+                _ACCOUNT_INSERT_SQL,
+                data.user_type,
+                email_1,
+                email_2,
+                password_hash,
+                data.first_name,
+                data.middle_name,
+                data.last_name,
+            )
+
+    async def delete(self, account_id: int) -> bool:
+        """Delete an account, returning whether it existed."""
+        record = await self._connection.fetchrow(_ACCOUNT_DELETE_SQL, account_id)
+        if record is None:
+            return False
+        if self._email_index is not None:
+            self._email_index.discard(record["email_1"], record["email_2"])
+        return True
+
+
+async def provide_user_service(
+    db_connection: Connection | PoolConnectionProxy,
+) -> UserService:
+    """Provide a ``UserService`` bound to the request connection."""
+    settings = get_settings().accounts
+    email_index = get_email_index() if settings.EMAIL_INDEX_ENABLED else None
+    return UserService(db_connection, email_index)
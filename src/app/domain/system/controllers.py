@@ -3,16 +3,26 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from asyncpg import ConnectionRejectionError
-from litestar import Controller, MediaType, get
-from litestar.response import Response
-from litestar.status_codes import HTTP_200_OK, HTTP_500_INTERNAL_SERVER_ERROR
+from litestar import Controller, MediaType, Request, get
+from litestar.exceptions import ServiceUnavailableException
+from litestar.status_codes import (
+    HTTP_200_OK,
+    HTTP_500_INTERNAL_SERVER_ERROR,
+    HTTP_503_SERVICE_UNAVAILABLE,
+)
 from structlog.stdlib import get_logger
 
-from .schemas import SystemHealth
-from .urls import SYSTEM_HEALTH
+from app.lib.db import get_database_guard
+from app.lib.serialization import Response
+from app.server.lifecycle import LifecyclePlugin
+
+from .schemas import DatabaseGuardStatus, SystemHealth, SystemReadiness
+from .urls import SYSTEM_HEALTH, SYSTEM_READY
 
 if TYPE_CHECKING:
-    from asyncpg import Connection
+    from typing import Any
+
+    from asyncpg import Pool
 
 
 logger = get_logger()
@@ -24,11 +34,15 @@ class SystemController(Controller):
     tags = ["system"]
 
     @get(path=SYSTEM_HEALTH, media_type=MediaType.JSON)
-    async def check_health(self, db_connection: Connection) -> Response[SystemHealth]:
+    async def check_health(self, db_pool: Pool) -> Response[SystemHealth]:
         """Check database availibility and return app info."""
+        # pinged through the guard rather than the connection dependency, so
+        # an open circuit is reported here instead of failing the request.
+        guard = get_database_guard()
         try:
-            await db_connection.execute("SELECT 1")
-        except ConnectionRejectionError:
+            async with guard.acquire(), db_pool.acquire() as db_connection:
+                await db_connection.execute("SELECT 1")
+        except (ConnectionRejectionError, ServiceUnavailableException):
             db_ping = False
         else:
             db_ping = True
@@ -43,7 +57,27 @@ class SystemController(Controller):
             await logger.awarning("System Health", database_status=db_status)
 
         return Response(
-            content=SystemHealth(database_status=db_status),
+            content=SystemHealth(
+                database_status=db_status,
+                database_guard=DatabaseGuardStatus(
+                    circuit=guard.breaker.state.value,
+                    failure_rate=round(guard.breaker.current_failure_rate, 3),
+                    concurrency_limit=guard.limiter.limit,
+                    in_flight=guard.limiter.in_flight,
+                ),
+            ),
             status_code=status_code,
             media_type=MediaType.JSON,
         )
+
+    @get(path=SYSTEM_READY, media_type=MediaType.JSON)
+    async def check_ready(
+        self, request: Request[Any, Any, Any]
+    ) -> Response[SystemReadiness]:
+        """Report whether the app has warmed up and is accepting traffic."""
+        lifecycle = request.app.plugins.get(LifecyclePlugin)
+        return Response(
+            content=SystemReadiness(ready=lifecycle.ready),
+            status_code=HTTP_200_OK if lifecycle.ready else HTTP_503_SERVICE_UNAVAILABLE,
+            media_type=MediaType.JSON,
+        )
@@ -1,18 +1,33 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
 from typing import Literal
 
 from app.__about__ import __version__ as current_version
 from app.config.settings import get_settings
+from app.lib.schema import BaseStruct
 
 settings = get_settings()
 
 
-@dataclass
-class SystemHealth:
+class DatabaseGuardStatus(BaseStruct):
+    """Represents the database circuit breaker and concurrency limiter."""
+
+    circuit: Literal["closed", "open", "half_open"]
+    failure_rate: float
+    concurrency_limit: int
+    in_flight: int
+
+
+class SystemHealth(BaseStruct):
     """Represents the system health."""
 
     database_status: Literal["online", "offline"]
+    database_guard: DatabaseGuardStatus
     app: str = settings.app.NAME
     version: str = current_version
+
+
+class SystemReadiness(BaseStruct):
+    """Represents whether the app is ready to serve traffic."""
+
+    ready: bool
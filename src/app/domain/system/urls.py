@@ -1 +1,2 @@
 SYSTEM_HEALTH: str = "/health"
+SYSTEM_READY: str = "/ready"
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import math
+from hashlib import blake2b
+
+__all__ = ("BloomFilter",)
+
+_MASK_64 = (1 << 64) - 1
+
+
+class BloomFilter:
+    """Fixed size Bloom filter over strings.
+
+    Membership tests never give false negatives, a miss means the value was
+    never added. A hit only means the value *may* have been added.
+    """
+
+    __slots__ = ("_bits", "_hash_count", "_size", "count")
+
+    def __init__(self, size: int, hash_count: int) -> None:
+        if size < 8 or hash_count < 1:
+            msg = "Bloom filter needs at least 8 bits and 1 hash function."
+            raise ValueError(msg)
+
+        self._size = size
+        self._hash_count = hash_count
+        self._bits = bytearray((size + 7) // 8)
+        self.count = 0
+
+    @classmethod
+    def for_capacity(
+        cls, capacity: int, error_rate: float, max_bytes: int | None = None
+    ) -> BloomFilter:
+        """Create a filter sized for ``capacity`` items at ``error_rate``.
+
+        When the optimal size exceeds ``max_bytes`` the filter is capped and
+        the hash count re-tuned for the smaller size, trading accuracy for memory.
+        """
+        if capacity < 1:
+            msg = "Bloom filter capacity must be positive."
+            raise ValueError(msg)
+        if not 0 < error_rate < 1:
+            msg = "Bloom filter error rate must be between 0 and 1."
+            raise ValueError(msg)
+
+        size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        if max_bytes is not None:
+            size = min(size, max_bytes * 8)
+        size = max(size, 8)
+        hash_count = max(1, round(size / capacity * math.log(2)))
+        return cls(size, hash_count)
+
+    @property
+    def size_bytes(self) -> int:
+        """Return the memory used by the bit array."""
+        return len(self._bits)
+
+    @property
+    def hash_count(self) -> int:
+        """Return the number of hash functions."""
+        return self._hash_count
+
+    def estimated_error_rate(self) -> float:
+        """Return the expected false positive rate at the current fill."""
+        return (
+            1 - math.exp(-self._hash_count * self.count / self._size)
+        ) ** self._hash_count
+
+    def _positions(self, value: str) -> list[int]:
+        # Kirsch-Mitzenmacher: k positions from two halves of a single digest.
+        digest = blake2b(value.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        size = self._size
+        return [((h1 + i * h2) & _MASK_64) % size for i in range(self._hash_count)]
+
+    def add(self, value: str) -> None:
+        """Add a value to the filter."""
+        bits = self._bits
+        for pos in self._positions(value):
+            bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, value: object) -> bool:
+        if not isinstance(value, str):
+            return False
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(value))
+
+    def __len__(self) -> int:
+        return self.count
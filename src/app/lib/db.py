@@ -0,0 +1,364 @@
+from __future__ import annotations
+
+import heapq
+import re
+from contextvars import ContextVar
+from functools import lru_cache
+from operator import itemgetter
+from time import perf_counter
+from typing import TYPE_CHECKING, cast, override
+
+import asyncpg
+import structlog
+from asyncpg import Connection
+from litestar.enums import ScopeType
+from litestar.middleware import ASGIMiddleware
+from litestar_asyncpg import AsyncpgConfig
+from litestar_asyncpg._utils import get_scope_state, set_scope_state  # noqa: PLC2701
+from structlog.stdlib import get_logger
+
+from app.config.settings import get_settings
+from app.lib.resilience import AdaptiveLimiter, CircuitBreaker, Guard
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+    from typing import Any
+
+    from asyncpg import Pool
+    from asyncpg.pool import PoolConnectionProxy
+    from litestar.datastructures import State
+    from litestar.types import ASGIApp, Message, Receive, Scope, Send
+
+__all__ = (
+    "GuardedAsyncpgConfig",
+    "InstrumentedConnection",
+    "QueryStats",
+    "QueryStatsMiddleware",
+    "fingerprint",
+    "get_database_guard",
+    "prepare_hot_statements",
+    "register_hot_statements",
+)
+
+
+logger = get_logger()
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+# ``$1`` style placeholders are kept, they are not literals.
+_NUMBER_LITERAL = re.compile(r"(?<![$\w])\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+# errors meaning the database itself is unhealthy, as opposed to a bad query.
+_DATABASE_FAILURES: tuple[type[BaseException], ...] = (
+    TimeoutError,
+    OSError,
+    asyncpg.InterfaceError,
+    asyncpg.PostgresConnectionError,
+    asyncpg.CannotConnectNowError,
+    asyncpg.TooManyConnectionsError,
+    asyncpg.QueryCanceledError,
+)
+
+_query_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+_hot_statements: dict[str, None] = {}
+
+
+def register_hot_statements(*queries: str) -> None:
+    """Register queries to prepare on every new pool connection."""
+    _hot_statements.update(dict.fromkeys(queries))
+
+
+async def prepare_hot_statements(connection: Connection | PoolConnectionProxy) -> None:
+    """Populate the statement cache of ``connection`` with the hot statements.
+
+    Used as the pool ``init`` callback so fresh connections never pay the
+    parse/plan round trip on their first request.
+    """
+    for query in _hot_statements:
+        try:
+            # the public ``prepare()`` skips the statement cache used by
+            # fetch/execute, asyncpg is pinned for this private call.
+            await connection._get_statement(query, None)  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType]
+        except Exception:  # noqa: BLE001
+            await logger.awarning(
+                "Could not prepare hot statement", query=fingerprint(query)
+            )
+
+
+@lru_cache(maxsize=1024)
+def fingerprint(query: str) -> str:
+    """Return ``query`` with literals and whitespace normalised.
+
+    Queries differing only by inlined values share a fingerprint.
+    """
+    query = _STRING_LITERAL.sub("?", query)
+    query = _NUMBER_LITERAL.sub("?", query)
+    query = _IN_LIST.sub("(?)", query)
+    return _WHITESPACE.sub(" ", query).strip()
+
+
+class QueryStats:
+    """Queries executed while handling a single request.
+
+    ``failures`` counts queries that failed because of the database itself
+    (see ``_DATABASE_FAILURES``), not because of the query.
+    """
+
+    __slots__ = ("count", "elapsed", "failures", "fingerprints")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.elapsed = 0.0
+        self.failures = 0
+        self.fingerprints: dict[str, int] = {}
+
+    def record(self, query: str, elapsed: float, *, failed: bool = False) -> None:
+        """Record an executed query."""
+        self.count += 1
+        self.elapsed += elapsed
+        if failed:
+            self.failures += 1
+        key = fingerprint(query)
+        self.fingerprints[key] = self.fingerprints.get(key, 0) + 1
+
+    def top(self, limit: int) -> dict[str, int]:
+        """Return the ``limit`` most executed fingerprints with their counts."""
+        return dict(heapq.nlargest(limit, self.fingerprints.items(), key=itemgetter(1)))
+
+    def repeated(self, threshold: int) -> dict[str, int]:
+        """Return fingerprints executed more than ``threshold`` times."""
+        return {key: n for key, n in self.fingerprints.items() if n > threshold}
+
+
+class InstrumentedConnection(Connection):
+    """Connection recording its queries into the active request's stats.
+
+    Outside of a request (startup scans, background tasks) queries are not
+    recorded. The stats also feed the database guard, see
+    ``GuardedAsyncpgConfig``.
+    """
+
+    @override
+    async def execute(self, query: str, *args: Any, **kwargs: Any) -> str:
+        stats = _query_stats.get()
+        if stats is None:
+            return await super().execute(query, *args, **kwargs)
+        start = perf_counter()
+        failed = False
+        try:
+            return await super().execute(query, *args, **kwargs)
+        except _DATABASE_FAILURES:
+            failed = True
+            raise
+        finally:
+            stats.record(query, perf_counter() - start, failed=failed)
+
+    @override
+    async def executemany(self, command: str, args: Any, **kwargs: Any) -> None:
+        stats = _query_stats.get()
+        if stats is None:
+            return await super().executemany(command, args, **kwargs)
+        start = perf_counter()
+        failed = False
+        try:
+            return await super().executemany(command, args, **kwargs)
+        except _DATABASE_FAILURES:
+            failed = True
+            raise
+        finally:
+            stats.record(command, perf_counter() - start, failed=failed)
+
+    @override
+    async def fetch(self, query: str, *args: Any, **kwargs: Any) -> list[Any]:
+        stats = _query_stats.get()
+        if stats is None:
+            return await super().fetch(query, *args, **kwargs)
+        start = perf_counter()
+        failed = False
+        try:
+            return await super().fetch(query, *args, **kwargs)
+        except _DATABASE_FAILURES:
+            failed = True
+            raise
+        finally:
+            stats.record(query, perf_counter() - start, failed=failed)
+
+    @override
+    async def fetchval(self, query: str, *args: Any, **kwargs: Any) -> Any:
+        stats = _query_stats.get()
+        if stats is None:
+            return await super().fetchval(query, *args, **kwargs)
+        start = perf_counter()
+        failed = False
+        try:
+            return await super().fetchval(query, *args, **kwargs)
+        except _DATABASE_FAILURES:
+            failed = True
+            raise
+        finally:
+            stats.record(query, perf_counter() - start, failed=failed)
+
+    @override
+    async def fetchrow(self, query: str, *args: Any, **kwargs: Any) -> Any:
+        stats = _query_stats.get()
+        if stats is None:
+            return await super().fetchrow(query, *args, **kwargs)
+        start = perf_counter()
+        failed = False
+        try:
+            return await super().fetchrow(query, *args, **kwargs)
+        except _DATABASE_FAILURES:
+            failed = True
+            raise
+        finally:
+            stats.record(query, perf_counter() - start, failed=failed)
+
+    @override
+    async def fetchmany(self, query: str, args: Any, **kwargs: Any) -> list[Any]:
+        stats = _query_stats.get()
+        if stats is None:
+            return await super().fetchmany(query, args, **kwargs)
+        start = perf_counter()
+        failed = False
+        try:
+            return await super().fetchmany(query, args, **kwargs)
+        except _DATABASE_FAILURES:
+            failed = True
+            raise
+        finally:
+            stats.record(query, perf_counter() - start, failed=failed)
+
+
+class QueryStatsMiddleware(ASGIMiddleware):
+    """Collect per request query stats and bind them into the log context.
+
+    The stats are bound when the response starts, so they are part of the
+    response log line emitted by the logging middleware. ``db_fingerprints``
+    maps the ``fingerprint_limit`` most executed fingerprints to their count.
+
+    With ``log_stats`` off the stats are only collected, for the database guard.
+    """
+
+    scopes = (ScopeType.HTTP,)
+
+    def __init__(
+        self,
+        repeat_threshold: int | None = None,
+        fingerprint_limit: int = 10,
+        *,
+        log_stats: bool = True,
+    ) -> None:
+        self.repeat_threshold = repeat_threshold
+        self.fingerprint_limit = fingerprint_limit
+        self.log_stats = log_stats
+
+    @override
+    async def handle(
+        self, scope: Scope, receive: Receive, send: Send, next_app: ASGIApp
+    ) -> None:
+        stats = QueryStats()
+        token = _query_stats.set(stats)
+        if not self.log_stats:
+            try:
+                await next_app(scope, receive, send)
+            finally:
+                _query_stats.reset(token)
+            return
+
+        bound: dict[str, Any] = {}
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                bound.update(
+                    structlog.contextvars.bind_contextvars(
+                        db_queries=stats.count,
+                        db_time_ms=round(stats.elapsed * 1000, 3),
+                        db_fingerprints=stats.top(self.fingerprint_limit),
+                    )
+                )
+            await send(message)
+
+        try:
+            await next_app(scope, receive, send_wrapper)
+        finally:
+            _query_stats.reset(token)
+            if self.repeat_threshold is not None:
+                for query, count in stats.repeated(self.repeat_threshold).items():
+                    await logger.awarning(
+                        "Repeated query, possible N+1",
+                        path=scope["path"],
+                        query=query,
+                        count=count,
+                    )
+            structlog.contextvars.reset_contextvars(**bound)
+
+
+@lru_cache(maxsize=1, typed=True)
+def get_database_guard() -> Guard:
+    """Return the guard shared by every database bound request."""
+    settings = get_settings().db
+    # permits beyond the pool size would only queue inside ``pool.acquire``.
+    max_limit = min(settings.LIMIT_MAX, settings.POOL_MAX_SIZE)
+    return Guard(
+        name="Database",
+        limiter=AdaptiveLimiter(
+            initial_limit=settings.LIMIT_INITIAL,
+            min_limit=min(settings.LIMIT_MIN, max_limit),
+            max_limit=max_limit,
+            latency_target=settings.LIMIT_LATENCY_TARGET / 1000,
+        ),
+        breaker=CircuitBreaker(
+            failure_rate=settings.BREAKER_FAILURE_RATE,
+            window=settings.BREAKER_WINDOW,
+            min_calls=settings.BREAKER_MIN_CALLS,
+            open_duration=settings.BREAKER_OPEN_DURATION,
+            probes=settings.BREAKER_PROBES,
+        ),
+        queue_timeout=settings.LIMIT_QUEUE_TIMEOUT / 1000,
+        slow_call=settings.BREAKER_SLOW_CALL / 1000,
+        failures=_DATABASE_FAILURES,
+    )
+
+
+class GuardedAsyncpgConfig(AsyncpgConfig):
+    """Asyncpg config whose request connections go through the database guard.
+
+    The permit is held from before the pool checkout until the handler is
+    done, so a slow database sheds load instead of queueing on the pool. A
+    connection already checked out for the request is reused as is.
+
+    Only the request's own queries are reported to the guard: their summed
+    time is the call latency, and the call failed only if a query or the
+    checkout failed because of the database. Time spent and exceptions raised
+    elsewhere in the handler are not held against the database.
+    """
+
+    @override
+    async def provide_connection(
+        self, state: State, scope: Scope
+    ) -> AsyncGenerator[Connection | PoolConnectionProxy]:
+        connection = cast(
+            "Connection | PoolConnectionProxy | None",
+            get_scope_state(scope, self.connection_scope_key),
+        )
+        if connection is not None:
+            yield connection
+            return
+
+        pool = cast("Pool", state.get(self.pool_app_state_key))
+        stats = _query_stats.get()
+        # a failed checkout is left to the guard, which classifies it by type.
+        async with get_database_guard().acquire() as call, pool.acquire() as connection:
+            set_scope_state(scope, self.connection_scope_key, connection)
+            count, elapsed, failures = (
+                (stats.count, stats.elapsed, stats.failures) if stats else (0, 0.0, 0)
+            )
+            try:
+                yield connection  # noqa: ASYNC119 - closed by litestar's dependency cleanup
+            finally:
+                if stats is None or stats.count == count:
+                    # no stats outside http requests, or no queries were made.
+                    call.report(None)
+                else:
+                    call.report(stats.elapsed - elapsed, failed=stats.failures > failures)
@@ -0,0 +1,351 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+from enum import StrEnum
+from time import monotonic, perf_counter
+from typing import TYPE_CHECKING
+
+from litestar.exceptions import ServiceUnavailableException
+from structlog.stdlib import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+__all__ = ("AdaptiveLimiter", "CircuitBreaker", "CircuitState", "Guard", "GuardCall")
+
+
+logger = get_logger()
+
+
+class CircuitState(StrEnum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency limit.
+
+    The limit grows by roughly one per ``limit`` fast completions and is
+    multiplied by ``backoff`` whenever a call fails or exceeds the latency
+    target. Callers over the limit wait in FIFO order.
+    """
+
+    __slots__ = (
+        "_in_flight",
+        "_limit",
+        "_waiters",
+        "backoff",
+        "latency_target",
+        "max_limit",
+        "min_limit",
+    )
+
+    def __init__(
+        self,
+        initial_limit: int,
+        min_limit: int,
+        max_limit: int,
+        latency_target: float,
+        backoff: float = 0.9,
+    ) -> None:
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_target = latency_target
+        self.backoff = backoff
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    @property
+    def limit(self) -> int:
+        """Return the current concurrency limit."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Return the number of calls holding a permit."""
+        return self._in_flight
+
+    def _wake(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
+
+    def _discard(self, waiter: asyncio.Future[None]) -> None:
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+
+    async def acquire(self, max_wait: float) -> bool:
+        """Wait up to ``max_wait`` seconds for a permit."""
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return True
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, max_wait)
+        except TimeoutError:
+            # woken by ``_wake`` in the iteration the deadline fired, the
+            # permit is already counted as ours.
+            if waiter.done() and not waiter.cancelled():
+                return True
+            self._discard(waiter)
+            return False
+        except BaseException:
+            if waiter.done() and not waiter.cancelled():
+                self.release(None)
+            else:
+                self._discard(waiter)
+            raise
+        return True
+
+    def release(self, latency: float | None, *, failed: bool = False) -> None:
+        """Return a permit, adjusting the limit from the call's outcome.
+
+        ``latency`` is ``None`` for permits given back without making a call.
+        """
+        self._in_flight -= 1
+        if latency is not None:
+            if failed or latency > self.latency_target:
+                self._limit = max(self.min_limit, self._limit * self.backoff)
+            else:
+                self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+        self._wake()
+
+
+class CircuitBreaker:
+    """Count based circuit breaker.
+
+    Opens once the failure rate over the last ``window`` calls reaches
+    ``failure_rate``, rejects calls for ``open_duration`` seconds, then lets
+    ``probes`` trial calls through and closes if they all succeed.
+    """
+
+    __slots__ = (
+        "_opened_at",
+        "_outcomes",
+        "_probe_successes",
+        "_probes",
+        "_state",
+        "failure_rate",
+        "min_calls",
+        "open_duration",
+        "probes",
+    )
+
+    def __init__(
+        self,
+        failure_rate: float,
+        window: int,
+        min_calls: int,
+        open_duration: float,
+        probes: int,
+    ) -> None:
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.open_duration = open_duration
+        self.probes = probes
+        self._outcomes: deque[bool] = deque(maxlen=window)
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._probes = 0
+        self._probe_successes = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Return the current state."""
+        if self._state is CircuitState.OPEN and self.retry_after <= 0:
+            return CircuitState.HALF_OPEN
+        return self._state
+
+    @property
+    def retry_after(self) -> float:
+        """Return the seconds until an open circuit starts probing."""
+        return self._opened_at + self.open_duration - monotonic()
+
+    @property
+    def current_failure_rate(self) -> float:
+        """Return the failure rate over the window."""
+        if not self._outcomes:
+            return 0.0
+        return sum(self._outcomes) / len(self._outcomes)
+
+    def _transition(self, state: CircuitState) -> None:
+        self._state = state
+        self._probes = 0
+        self._probe_successes = 0
+        if state is CircuitState.OPEN:
+            self._opened_at = monotonic()
+        elif state is CircuitState.CLOSED:
+            self._outcomes.clear()
+
+    def allow(self) -> bool:
+        """Return whether a call may proceed, reserving a probe when half open."""
+        if self._state is CircuitState.CLOSED:
+            return True
+        if self._state is CircuitState.OPEN:
+            if self.retry_after > 0:
+                return False
+            self._transition(CircuitState.HALF_OPEN)
+        if self._probes >= self.probes:
+            return False
+        self._probes += 1
+        return True
+
+    def skip(self) -> None:
+        """Give back an allowed call that ended without calling the dependency."""
+        if self._state is CircuitState.HALF_OPEN and self._probes > 0:
+            self._probes -= 1
+
+    def record(self, *, failed: bool) -> None:
+        """Record the outcome of an allowed call."""
+        if self._state is CircuitState.HALF_OPEN:
+            if failed:
+                self._transition(CircuitState.OPEN)
+                return
+            self._probe_successes += 1
+            if self._probe_successes >= self.probes:
+                self._transition(CircuitState.CLOSED)
+            return
+        if self._state is CircuitState.OPEN:
+            return
+
+        self._outcomes.append(failed)
+        if (
+            failed
+            and len(self._outcomes) >= self.min_calls
+            and self.current_failure_rate >= self.failure_rate
+        ):
+            self._transition(CircuitState.OPEN)
+
+
+class GuardCall:
+    """Outcome of a call made under a ``Guard`` permit.
+
+    Unless the caller reports the outcome, the whole block is timed and only
+    ``Guard.failures`` exceptions escaping it count as failures.
+    """
+
+    __slots__ = ("failed", "latency", "reported")
+
+    def __init__(self) -> None:
+        self.reported = False
+        self.latency: float | None = None
+        self.failed = False
+
+    def report(self, latency: float | None, *, failed: bool = False) -> None:
+        """Report the time spent in the dependency and whether it failed.
+
+        ``latency`` is ``None`` when the dependency was not called at all.
+        """
+        self.reported = True
+        self.latency = latency
+        self.failed = failed
+
+
+class Guard:
+    """Adaptive limiter and circuit breaker around a dependency.
+
+    Calls beyond the limit queue for at most ``queue_timeout`` seconds, calls
+    rejected by either fail fast with a 503. Only failed calls and calls
+    slower than ``slow_call`` seconds count against the breaker, see
+    ``GuardCall``. Breaker state changes are logged as calls observe them.
+    """
+
+    __slots__ = (
+        "_reported_state",
+        "breaker",
+        "failures",
+        "limiter",
+        "name",
+        "queue_timeout",
+        "slow_call",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        limiter: AdaptiveLimiter,
+        breaker: CircuitBreaker,
+        queue_timeout: float,
+        slow_call: float,
+        failures: tuple[type[BaseException], ...],
+    ) -> None:
+        self.name = name
+        self.limiter = limiter
+        self.breaker = breaker
+        self.queue_timeout = queue_timeout
+        self.slow_call = slow_call
+        self.failures = failures
+        self._reported_state = breaker.state
+
+    def _unavailable(self, reason: str) -> ServiceUnavailableException:
+        retry_after = max(1, round(self.breaker.retry_after))
+        return ServiceUnavailableException(
+            detail=f"{self.name} {reason}.", headers={"Retry-After": str(retry_after)}
+        )
+
+    async def _report_state(self) -> None:
+        state = self.breaker.state
+        previous, self._reported_state = self._reported_state, state
+        if state is previous:
+            return
+        log = logger.awarning if state is CircuitState.OPEN else logger.ainfo
+        await log(
+            "Circuit state changed",
+            name=self.name,
+            previous=previous.value,
+            state=state.value,
+            failure_rate=round(self.breaker.current_failure_rate, 3),
+        )
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncGenerator[GuardCall]:
+        """Hold a permit for the duration of the block.
+
+        Yields
+        ------
+        GuardCall
+            The call, for the caller to report its outcome to.
+        """
+        await self._report_state()
+        if self.breaker.state is CircuitState.OPEN:
+            msg = "circuit is open"
+            raise self._unavailable(msg)
+        if not await self.limiter.acquire(self.queue_timeout):
+            msg = "is overloaded"
+            raise self._unavailable(msg)
+        if not self.breaker.allow():
+            self.limiter.release(None)
+            msg = "circuit is open"
+            raise self._unavailable(msg)
+
+        call = GuardCall()
+        start = perf_counter()
+        failed = False
+        try:
+            yield call
+        except self.failures:
+            failed = True
+            raise
+        finally:
+            if call.reported:
+                latency, failed = call.latency, call.failed
+            else:
+                latency = perf_counter() - start
+            self.limiter.release(latency, failed=failed)
+            if latency is None:
+                self.breaker.skip()
+            else:
+                self.breaker.record(failed=failed or latency > self.slow_call)
+            await self._report_state()
@@ -1,11 +1,50 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import re
+from functools import cache
+from typing import TYPE_CHECKING, Any, cast
 
+import msgspec
 from msgspec import UNSET, Struct
 
 if TYPE_CHECKING:
-    from typing import Any
+    from collections.abc import Callable
+
+__all__ = (
+    "BaseStruct",
+    "StructValidationError",
+    "decode_json",
+    "decode_msgpack",
+    "get_json_decoder",
+    "get_msgpack_decoder",
+    "validate",
+    "validator",
+)
+
+_ERROR_PATH = re.compile(r"^(?P<message>.*?)(?: - at `\$\.?(?P<key>[^`]*)`)?$")
+
+
+class StructValidationError(ValueError):
+    """Raised when a request body fails decoding or validation."""
+
+    def __init__(self, errors: list[dict[str, str]]) -> None:
+        super().__init__(errors)
+        self.errors = errors
+
+
+def validator[F: Callable[..., Any]](*fields: str) -> Callable[[F], F]:
+    """Mark a ``BaseStruct`` static method as a validation hook for ``fields``.
+
+    The hook receives each non-null field value and returns the value to
+    store, or raises ``ValueError`` with a message describing the problem.
+    Hooks are collected once per class, on first use.
+    """
+
+    def decorator(func: F) -> F:
+        func.__validates__ = fields  # pyright: ignore[reportFunctionMemberAccess]
+        return func
+
+    return decorator
 
 
 class BaseStruct(Struct):
@@ -14,3 +53,105 @@ class BaseStruct(Struct):
     def to_dict(self) -> dict[str, Any]:
         """Return dict form of the struct."""
         return {f: getattr(self, f) for f in self.__struct_fields__ if getattr(self, f, None) != UNSET}
+
+
+@cache
+def _compile_validators(
+    struct_type: type[BaseStruct],
+) -> tuple[tuple[str, Callable[[Any], Any]], ...]:
+    hooks: list[tuple[str, Callable[[Any], Any]]] = []
+    seen: set[str] = set()
+    for klass in struct_type.__mro__:
+        for name, attr in vars(klass).items():
+            fields = getattr(attr, "__validates__", None) or getattr(
+                getattr(attr, "__func__", None), "__validates__", None
+            )
+            if fields is None or name in seen:
+                continue
+            seen.add(name)
+            bound = getattr(struct_type, name)
+            hooks.extend((field, bound) for field in fields)
+    return tuple(hooks)
+
+
+def validate[T: BaseStruct](obj: T) -> T:
+    """Run the validation hooks of ``obj``'s class, collecting every error."""
+    hooks = _compile_validators(type(obj))
+    if not hooks:
+        return obj
+
+    errors: list[dict[str, str]] = []
+    for field, hook in hooks:
+        value = getattr(obj, field)
+        if value is None or value is UNSET:
+            continue
+        try:
+            setattr(obj, field, hook(value))
+        except ValueError as exc:
+            errors.append({"message": str(exc), "key": field, "source": "body"})
+
+    if errors:
+        raise StructValidationError(errors)
+    return obj
+
+
+def _validate_any(obj: Any) -> Any:
+    if isinstance(obj, BaseStruct):
+        return validate(obj)
+    if not isinstance(obj, (list, tuple)):
+        return obj
+
+    items = cast("list[Any] | tuple[Any, ...]", obj)
+    errors: list[dict[str, str]] = []
+    for index, item in enumerate(items):
+        try:
+            _validate_any(item)
+        except StructValidationError as exc:
+            errors.extend(
+                {**error, "key": f"[{index}].{error['key']}"} for error in exc.errors
+            )
+    if errors:
+        raise StructValidationError(errors)
+    return items
+
+
+def _decode_error(exc: msgspec.DecodeError) -> StructValidationError:
+    match = _ERROR_PATH.match(str(exc))
+    assert match is not None
+    return StructValidationError([
+        {"message": match["message"], "key": match["key"] or "", "source": "body"}
+    ])
+
+
+@cache
+def get_json_decoder[T](type_: type[T]) -> msgspec.json.Decoder[T]:
+    """Return the JSON decoder for ``type_``, created once per type."""
+    return msgspec.json.Decoder(type_)
+
+
+@cache
+def get_msgpack_decoder[T](type_: type[T]) -> msgspec.msgpack.Decoder[T]:
+    """Return the msgpack decoder for ``type_``, created once per type."""
+    return msgspec.msgpack.Decoder(type_)
+
+
+def decode_json[T](type_: type[T], data: bytes) -> T:
+    """Decode and validate JSON ``data`` directly into ``type_``.
+
+    ``msgspec.Meta`` constraints stop at the first failure, the validation
+    hooks that follow all run and report their errors together.
+    """
+    try:
+        obj = get_json_decoder(type_).decode(data)
+    except msgspec.DecodeError as exc:
+        raise _decode_error(exc) from exc
+    return _validate_any(obj)
+
+
+def decode_msgpack[T](type_: type[T], data: bytes) -> T:
+    """Decode and validate msgpack ``data`` directly into ``type_``."""
+    try:
+        obj = get_msgpack_decoder(type_).decode(data)
+    except msgspec.DecodeError as exc:
+        raise _decode_error(exc) from exc
+    return _validate_any(obj)
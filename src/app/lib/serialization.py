@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from functools import cache
+from typing import TYPE_CHECKING, Any, get_args, get_origin, override
+
+import msgspec
+from litestar import MediaType
+from litestar import Request as _Request
+from litestar import Response as _Response
+from litestar.exceptions import ValidationException
+from litestar.serialization import default_serializer
+
+from app.lib.schema import BaseStruct, StructValidationError, decode_json, decode_msgpack
+
+if TYPE_CHECKING:
+    from litestar import Litestar
+    from litestar.datastructures import State
+    from litestar.response.base import ASGIResponse
+    from litestar.types import Serializer
+
+__all__ = (
+    "MSGPACK",
+    "Request",
+    "Response",
+    "encode_msgpack",
+    "is_msgpack",
+)
+
+MSGPACK = "application/msgpack"
+MSGPACK_MEDIA_TYPES = (MSGPACK, MediaType.MESSAGEPACK.value, "application/vnd.msgpack")
+_NEGOTIABLE_MEDIA_TYPES = (MediaType.JSON.value, *MSGPACK_MEDIA_TYPES)
+
+_msgpack_encoder = msgspec.msgpack.Encoder(enc_hook=default_serializer)
+
+
+def is_msgpack(media_type: str) -> bool:
+    """Return whether ``media_type`` names msgpack."""
+    return media_type.partition(";")[0].strip().lower() in MSGPACK_MEDIA_TYPES
+
+
+def encode_msgpack(obj: Any) -> bytes:
+    """Encode ``obj`` to msgpack with the shared encoder."""
+    return _msgpack_encoder.encode(obj)
+
+
+def _struct_type(annotation: Any) -> Any | None:
+    """Return ``annotation`` if it is a ``BaseStruct`` or a list/tuple of them."""
+    if isinstance(annotation, type):
+        return annotation if issubclass(annotation, BaseStruct) else None
+    if get_origin(annotation) in {list, tuple} and all(
+        _struct_type(arg) is not None
+        for arg in get_args(annotation)
+        if arg is not Ellipsis
+    ):
+        return annotation
+    return None
+
+
+@cache
+def _returns_structs(return_annotation: Any) -> bool:
+    """Return whether a handler annotated ``return_annotation`` returns structs.
+
+    ``Response[...]`` annotations are unwrapped to their content type.
+    """
+    origin = get_origin(return_annotation)
+    if isinstance(origin, type) and issubclass(origin, _Response):
+        args = get_args(return_annotation)
+        return_annotation = args[0] if args else None
+    return _struct_type(return_annotation) is not None
+
+
+def _is_struct_response(content: Any, request: _Request[Any, Any, Any]) -> bool:
+    # decided by the handler's annotation so empty lists are negotiated too,
+    # the content check keeps error responses of the same handler as JSON.
+    if not isinstance(content, (BaseStruct, list, tuple)):
+        return False
+    signature = getattr(request.route_handler, "parsed_fn_signature", None)
+    if signature is None:
+        return False
+    return _returns_structs(signature.return_type.annotation)
+
+
+def _vary_on_accept(headers: dict[str, Any]) -> None:
+    """Add ``Accept`` to the ``Vary`` header, keeping any existing values."""
+    key = next((name for name in headers if name.lower() == "vary"), "Vary")
+    values = [value.strip() for value in str(headers.get(key, "")).split(",")]
+    values = [value for value in values if value]
+    if not any(value == "*" or value.lower() == "accept" for value in values):
+        headers[key] = ", ".join([*values, "Accept"])
+
+
+class Request[UserT, AuthT, StateT: State](_Request[UserT, AuthT, StateT]):
+    """Request accepting msgpack bodies in place of JSON.
+
+    ``BaseStruct`` bodies are decoded straight from the raw bytes into the
+    handler's data type and validated, see ``app.lib.schema``.
+    """
+
+    def _data_type(self) -> Any | None:
+        data_field = getattr(self.route_handler, "parsed_data_field", None)
+        return _struct_type(data_field.annotation) if data_field is not None else None
+
+    async def _decode(self, data_type: Any, *, msgpack: bool) -> Any:
+        body = await self.body()
+        try:
+            if msgpack:
+                return decode_msgpack(data_type, body)
+            return decode_json(data_type, body)
+        except StructValidationError as exc:
+            raise ValidationException(
+                detail=f"Validation failed for {self.method} {self.url}",
+                extra=exc.errors,
+            ) from exc
+
+    @override
+    async def json(self) -> Any:
+        if is_msgpack(self.headers.get("content-type", "")):
+            return await self.msgpack()
+        if (data_type := self._data_type()) is None:
+            return await super().json()
+        return await self._decode(data_type, msgpack=False)
+
+    @override
+    async def msgpack(self) -> Any:
+        if (data_type := self._data_type()) is None:
+            return await super().msgpack()
+        return await self._decode(data_type, msgpack=True)
+
+
+class Response[T](_Response[T]):
+    """Response encoding ``BaseStruct`` content as msgpack when the client prefers it."""
+
+    @override
+    def to_asgi_response(
+        self, app: Litestar | None, request: _Request[Any, Any, Any], **kwargs: Any
+    ) -> ASGIResponse:
+        if _is_struct_response(self.content, request):
+            _vary_on_accept(self.headers)
+            best = request.accept.best_match(list(_NEGOTIABLE_MEDIA_TYPES))
+            if best is not None and is_msgpack(best):
+                self.media_type = MSGPACK
+        return super().to_asgi_response(app, request, **kwargs)  # pyright: ignore[reportUnknownMemberType]
+
+    @override
+    def render(
+        self, content: Any, media_type: str, enc_hook: Serializer = default_serializer
+    ) -> bytes:
+        if is_msgpack(media_type):
+            return encode_msgpack(content)
+        return super().render(content, media_type, enc_hook)
@@ -21,7 +21,10 @@ class ApplicationCore(InitPluginProtocol):
         from app.config.app import get_config
         from app.config.settings import get_settings
         from app.domain.accounts.controllers.auth import AuthController
+        from app.domain.accounts.services import get_email_index
         from app.domain.system.controllers import SystemController
+        from app.lib.db import QueryStatsMiddleware
+        from app.lib.serialization import Request, Response
         from app.server.plugins import get_plugins
 
         settings = get_settings()
@@ -29,6 +32,9 @@ class ApplicationCore(InitPluginProtocol):
         plugins = get_plugins()
 
         app_config.debug = settings.app.DEBUG
+        # msgpack content negotiation
+        app_config.request_class = Request
+        app_config.response_class = Response
         # openapi
         app_config.openapi_config = config.openapi
         # cors
@@ -41,8 +47,25 @@ class ApplicationCore(InitPluginProtocol):
             plugins.granian,
             plugins.asyncpg,
             plugins.problem_details,
+            # after asyncpg, its lifespan has to run inside the pool's.
+            plugins.lifecycle,
         ])
 
+        # db instrumentation, always collected as it feeds the database guard.
+        app_config.middleware.append(
+            QueryStatsMiddleware(
+                repeat_threshold=settings.db.QUERY_REPEAT_THRESHOLD
+                if settings.app.DEBUG
+                else None,
+                log_stats=settings.db.QUERY_INSTRUMENTATION,
+            )
+        )
+        # accounts
+        if settings.accounts.EMAIL_INDEX_ENABLED:
+            email_index = get_email_index()
+            app_config.on_startup.append(email_index.on_startup)
+            app_config.on_shutdown.append(email_index.on_shutdown)
+
         app_config.route_handlers.extend([
             SystemController,
             AuthController
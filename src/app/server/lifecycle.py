@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import asyncio
+import signal
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, override
+
+from litestar.enums import ScopeType
+from litestar.exceptions import ServiceUnavailableException
+from litestar.middleware import ASGIMiddleware
+from litestar.plugins import InitPluginProtocol
+from structlog.stdlib import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+    from types import FrameType
+
+    from asyncpg import Pool
+    from asyncpg.pool import PoolConnectionProxy
+    from litestar import Litestar
+    from litestar.config.app import AppConfig
+    from litestar.types import ASGIApp, Receive, Scope, Send
+
+__all__ = ("LifecyclePlugin",)
+
+
+logger = get_logger()
+
+
+class _InFlightMiddleware(ASGIMiddleware):
+    scopes = (ScopeType.HTTP,)
+
+    def __init__(self, lifecycle: LifecyclePlugin) -> None:
+        self.lifecycle = lifecycle
+
+    @override
+    async def handle(
+        self, scope: Scope, receive: Receive, send: Send, next_app: ASGIApp
+    ) -> None:
+        lifecycle = self.lifecycle
+        if lifecycle.draining:
+            raise ServiceUnavailableException(
+                detail="Server is shutting down.",
+                headers={"Connection": "close", "Retry-After": "1"},
+            )
+
+        lifecycle.in_flight += 1
+        try:
+            await next_app(scope, receive, send)
+        finally:
+            lifecycle.in_flight -= 1
+            if lifecycle.draining and not lifecycle.in_flight:
+                lifecycle.idle.set()
+
+
+class LifecyclePlugin(InitPluginProtocol):
+    """Startup warm-up and graceful drain.
+
+    Must be registered after the asyncpg plugin so its lifespan runs inside
+    the pool's: the pool is warm before the app reports ready and is only
+    closed once in-flight requests have finished.
+    """
+
+    __slots__ = (
+        "draining",
+        "idle",
+        "in_flight",
+        "pool_app_state_key",
+        "ready",
+        "timeout",
+    )
+
+    def __init__(self, pool_app_state_key: str, drain_timeout: int) -> None:
+        self.pool_app_state_key = pool_app_state_key
+        self.timeout = drain_timeout
+        self.ready = False
+        self.draining = False
+        self.in_flight = 0
+        self.idle = asyncio.Event()
+
+    def on_app_init(self, app_config: AppConfig) -> AppConfig:
+        """Register the lifespan and in-flight tracking middleware."""
+        app_config.lifespan.append(self.lifespan)  # pyright: ignore[reportUnknownMemberType]
+        app_config.middleware.insert(0, _InFlightMiddleware(self))
+        return app_config
+
+    def start_draining(self) -> None:
+        """Stop accepting new requests and report not ready."""
+        if self.draining:
+            return
+        self.ready = False
+        self.draining = True
+        if not self.in_flight:
+            self.idle.set()
+
+    def _install_signal_handler(self) -> None:
+        # Only chain onto handlers installed from python, a server handling
+        # signals natively keeps full control and we drain on lifespan shutdown.
+        previous = signal.getsignal(signal.SIGTERM)
+        if not callable(previous):
+            return
+        loop = asyncio.get_running_loop()
+
+        def handler(signum: int, frame: FrameType | None) -> None:
+            loop.call_soon_threadsafe(self.start_draining)
+            previous(signum, frame)
+
+        try:
+            signal.signal(signal.SIGTERM, handler)
+        except ValueError:
+            # not the main thread.
+            pass
+
+    async def _warm_up(self, pool: Pool) -> None:
+        # hot statements are prepared by the pool ``init`` callback, this
+        # makes sure ``min_size`` connections are open and usable up front.
+        connections: list[PoolConnectionProxy] = []
+        try:
+            for _ in range(pool.get_min_size()):
+                connections.append(await pool.acquire())  # noqa: PERF401
+            await asyncio.gather(*(conn.execute("SELECT 1") for conn in connections))
+        finally:
+            for conn in connections:
+                await pool.release(conn)
+
+    async def _drain(self, pool: Pool) -> None:
+        self.start_draining()
+        try:
+            await asyncio.wait_for(self.idle.wait(), timeout=self.timeout)
+        except TimeoutError:
+            await logger.awarning(
+                "Drain deadline reached, terminating pool", in_flight=self.in_flight
+            )
+            pool.terminate()
+        else:
+            await logger.ainfo("Drained in-flight requests")
+
+    @asynccontextmanager
+    async def lifespan(self, app: Litestar) -> AsyncGenerator[None]:
+        """Warm up the pool, then drain requests on shutdown."""
+        # the plugin is a process wide singleton, a previous app may have drained it.
+        self.draining = False
+        self.in_flight = 0
+        self.idle = asyncio.Event()
+        pool: Pool = app.state[self.pool_app_state_key]
+        await self._warm_up(pool)
+        self._install_signal_handler()
+        self.ready = True
+        try:
+            yield
+        finally:
+            await self._drain(pool)
@@ -7,10 +7,13 @@ from litestar_asyncpg import AsyncpgPlugin
 from litestar_granian import GranianPlugin
 
 from app.config.app import get_config
+from app.config.settings import get_settings
+from app.server.lifecycle import LifecyclePlugin
 
 __all__ = ("get_plugins",)
 
 config = get_config().plugins
+settings = get_settings()
 
 
 @dataclass
@@ -21,6 +24,12 @@ class Plugins:
     granian: GranianPlugin = field(default_factory=GranianPlugin)
     problem_details: ProblemDetailsPlugin = field(default_factory=lambda: ProblemDetailsPlugin(config=config.PROBLEM_DETAILS))
     asyncpg: AsyncpgPlugin = field(default_factory=lambda: AsyncpgPlugin(config=config.ASYNCPG))
+    lifecycle: LifecyclePlugin = field(
+        default_factory=lambda: LifecyclePlugin(
+            pool_app_state_key=settings.db.POOL_APP_STATE_KEY,
+            drain_timeout=settings.server.DRAIN_TIMEOUT,
+        )
+    )
 
 
 @lru_cache(maxsize=1, typed=True)
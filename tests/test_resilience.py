@@ -0,0 +1,51 @@
+"""Tests for ``app.lib.resilience``.
+
+Run from the project root with ``uv run python -m unittest``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import unittest
+
+from app.lib.resilience import AdaptiveLimiter
+
+
+class AdaptiveLimiterTest(unittest.IsolatedAsyncioTestCase):
+    """Permit accounting of ``AdaptiveLimiter``."""
+
+    async def test_times_out_when_no_permit_frees_up(self) -> None:
+        """A waiter past its deadline gets no permit and leaves none behind."""
+        limiter = AdaptiveLimiter(
+            initial_limit=1, min_limit=1, max_limit=1, latency_target=1
+        )
+        assert await limiter.acquire(0)
+
+        assert not await limiter.acquire(0.01)
+        limiter.release(None)
+        assert limiter.in_flight == 0
+
+    async def test_wake_and_deadline_in_the_same_iteration(self) -> None:
+        """A waiter woken as its deadline fires keeps the permit it was given."""
+        limiter = AdaptiveLimiter(
+            initial_limit=1, min_limit=1, max_limit=1, latency_target=1
+        )
+        assert await limiter.acquire(0)
+
+        loop = asyncio.get_running_loop()
+        # block the loop past both the release and the deadline, so both
+        # timers run in the same iteration, release first.
+        loop.call_later(0.01, time.sleep, 0.1)
+        loop.call_later(0.04, limiter.release, 0.001)
+
+        acquired = await limiter.acquire(0.05)
+        assert limiter.in_flight == int(acquired)
+        if acquired:
+            limiter.release(0.001)
+        assert limiter.in_flight == 0
+        assert await limiter.acquire(0)
+
+
+if __name__ == "__main__":
+    unittest.main()